@@ -1,23 +1,45 @@
 import argparse
 import os.path
 
-from .core import (ImageFinder, TwoPerPage, ThreePerPage, FourPerPage, MaxHeightLandscape,
-                   ImageCountError)
+from .scan import find_image_paths, count_pages
 
 
-PER_PAGE = [TwoPerPage, ThreePerPage, FourPerPage]
+def dry_run(args, image_count):
+    '''
+    Reports the number of output pages without opening any images.
+    '''
+    if args.count:
+        print('Would create {} page(s) with {} photo(s) per page'.format(
+            count_pages(image_count, args.count), args.count))
+    else:
+        print('Page count depends on the photo sizes when using --max-height')
 
 
 def run(args):
-    image_finder = ImageFinder(args.source)
+    try:
+        image_count = sum(1 for _ in find_image_paths(args.source))
+    except ValueError as e:
+        print(e)
+        exit(1)
 
     print()
     print('-' * 50)
     print('Found {} photo(s) in \'{}\''.format(
-        image_finder.image_count,
+        image_count,
         os.path.abspath(os.path.expanduser(args.source))
     ))
     print('-' * 50)
+    if args.dry_run:
+        dry_run(args, image_count)
+        return
+
+    # ``core`` pulls in Pillow, which is slow to import. Deferring it until there is
+    # work to do keeps ``--help``, ``--version`` and ``--dry-run`` fast.
+    from .core import (ImageFinder, TwoPerPage, ThreePerPage, FourPerPage, MaxHeightLandscape,
+                       ImageCountError)
+    per_page = [TwoPerPage, ThreePerPage, FourPerPage]
+
+    image_finder = ImageFinder(args.source)
     dest = os.path.abspath(os.path.expanduser(args.dest))
     if os.path.exists(dest) and not os.path.isdir(dest):
         print('\'{}\' exists, but is not a folder'.format(dest))
@@ -27,7 +49,7 @@ def run(args):
         os.makedirs(dest, exist_ok=True)
 
     if args.count:
-        output = PER_PAGE[args.count - 2](dest)
+        output = per_page[args.count - 2](dest)
     elif args.max_height:
         output = MaxHeightLandscape(dest, args.max_height)
 
@@ -59,7 +81,7 @@ def run(args):
         exit(1)
 
 
-def main():
+def make_parser():
     parser = argparse.ArgumentParser(description='Combines multiple images into one for printing',
                                      prog='image-parser')
     group_required = parser.add_argument_group(description='Modes:')
@@ -71,8 +93,14 @@ def main():
                                 'before combining')
     parser.add_argument('source', help='path to the source files')
     parser.add_argument('dest', help='path where the final images will be saved')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='report the number of photos and pages without creating anything')
     parser.add_argument('--version', action='version', version='%(prog)s 0.0.1')
-    args = parser.parse_args()
+    return parser
+
+
+def main(argv=None):
+    args = make_parser().parse_args(argv)
     run(args)
 
 if __name__ == '__main__':
@@ -5,6 +5,8 @@ import decimal
 
 from PIL import Image
 
+from .scan import find_image_paths
+
 
 class ImageMergeError(Exception):
     pass
@@ -28,23 +30,26 @@ class ImageFinder:
         if not self._path.is_dir():
             raise ValueError('{} must be a directory'.format('path'))
 
-        self._image_count = 0
-        self._count_images()
+        # counted on first access, so creating a finder doesn't open every file
+        self._image_count = None
 
     def __iter__(self):
-        for path in self._path.iterdir():
-            if not path.match('.*') and path.is_file():
-                yield Image.open(str(path.absolute()))
+        for path in find_image_paths(self._path):
+            yield Image.open(str(path.absolute()))
 
     @property
     def image_count(self):
+        if self._image_count is None:
+            self._image_count = self._count_images()
         return self._image_count
 
     def _count_images(self):
-        for file_ in self._path.iterdir():
-            if not file_.match('.*') and file_.is_file():
-                Image.open(str(file_.absolute()))
-                self._image_count += 1
+        image_count = 0
+        for file_ in find_image_paths(self._path):
+            # opening only reads the header, which verifies it is an image
+            with Image.open(str(file_.absolute())):
+                image_count += 1
+        return image_count
 
 
 class BaseOutputImage:
@@ -0,0 +1,33 @@
+'''
+Cheap directory scanning that does not depend on Pillow.
+
+Kept separate from ``core`` so the command line interface can report on a
+folder without paying for the Pillow import.
+'''
+import math
+import os.path
+import pathlib
+
+
+def find_image_paths(path):
+    '''
+    Yields the candidate image files within ``path``. Hidden files and
+    sub-directories are skipped. Files are not opened.
+
+    :param str path: The path of the folder to look in
+    '''
+    path = pathlib.Path(os.path.expanduser(path))
+    if not path.is_dir():
+        raise ValueError('{} must be a directory'.format(path))
+
+    for file_ in path.iterdir():
+        if not file_.match('.*') and file_.is_file():
+            yield file_
+
+
+def count_pages(image_count, images_per_page):
+    '''
+    Returns the number of output pages needed for ``image_count`` images
+    when ``images_per_page`` images are combined onto each page.
+    '''
+    return math.ceil(image_count / images_per_page)
@@ -0,0 +1,74 @@
+import unittest
+import pathlib
+import os
+import sys
+import subprocess
+import time
+import io
+import contextlib
+
+from ..cli import make_parser, run
+from ..scan import count_pages
+
+# maximum time in seconds allowed for ``image-merge --help``
+STARTUP_BUDGET = float(os.environ.get('IMAGE_MERGE_STARTUP_BUDGET', '1.0'))
+
+PACKAGE_ROOT = pathlib.Path(__file__).parent.parent.parent.as_posix()
+
+
+class testStartup(unittest.TestCase):
+
+    def _python(self, *args):
+        return subprocess.run([sys.executable] + list(args), cwd=PACKAGE_ROOT,
+                              stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                              universal_newlines=True, check=True)
+
+    def test_parse_args_does_not_import_pillow(self):
+        result = self._python(
+            '-c',
+            'import sys\n'
+            'from image_merge.cli import make_parser\n'
+            'make_parser().parse_args(["--count", "2", "src", "dest"])\n'
+            'print("PIL" in sys.modules)\n')
+        self.assertEqual(result.stdout.strip(), 'False')
+
+    def test_help_startup_time(self):
+        start = time.perf_counter()
+        result = self._python('-m', 'image_merge.cli', '--help')
+        elapsed = time.perf_counter() - start
+        print('image-merge --help took {:.3f}s'.format(elapsed))
+        self.assertIn('--dry-run', result.stdout)
+        self.assertLess(elapsed, STARTUP_BUDGET)
+
+
+class testDryRun(unittest.TestCase):
+
+    IMAGE_DIR = (pathlib.Path(__file__).parent / 'images').as_posix()
+
+    def _run(self, argv):
+        args = make_parser().parse_args(argv)
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            run(args)
+        return output.getvalue()
+
+    def test_count(self):
+        dest = os.path.join(self.IMAGE_DIR, 'does-not-exist')
+        output = self._run(['--dry-run', '--count', '2', self.IMAGE_DIR, dest])
+        self.assertIn('Found 1 photo(s)', output)
+        self.assertIn('Would create 1 page(s)', output)
+        self.assertFalse(os.path.exists(dest))
+
+    def test_max_height(self):
+        output = self._run(['--dry-run', '--max-height', '5', self.IMAGE_DIR, '/tmp/'])
+        self.assertIn('Found 1 photo(s)', output)
+        self.assertIn('depends on the photo sizes', output)
+
+    def test_count_pages(self):
+        self.assertEqual(count_pages(0, 2), 0)
+        self.assertEqual(count_pages(4, 2), 2)
+        self.assertEqual(count_pages(5, 2), 3)
+        self.assertEqual(count_pages(5, 4), 2)
+
+if __name__ == '__main__':
+    unittest.main()